@@ -9,11 +9,13 @@ def check_run_time(count_decimal_places: int = 2) -> Any:
     :param count_decimal_places Количество знаков после запятой
     """
     def decorator(func):
+        clock = time.perf_counter_ns
+
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = clock()
             func(*args, **kwargs)
-            finish_time = time.time()
-            return finish_time-start_time
+            finish_time = clock()
+            return (finish_time - start_time) / 1_000_000_000
         return wrapper
     return decorator
 
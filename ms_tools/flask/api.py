@@ -15,19 +15,23 @@ def get_params(schema, **schema_params):
     """
 
     def decorator(func):
+        schema_instance = schema(**schema_params)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             data = None
-            if request.method == 'GET':
-                data = request.args
-            elif request.method in ['POST', 'PUT', 'DELETE']:
-                if not request.is_json:
+            current_request = request._get_current_object()
+            method = current_request.method
+            if method == 'GET':
+                data = current_request.args
+            elif method in ('POST', 'PUT', 'DELETE'):
+                if not current_request.is_json:
                     return {'errors': {"common": "Cannot parse json"}}, 400
-                data = request.json
+                data = current_request.json
 
             # Load params
             try:
-                params = (schema(**schema_params).load(data),)
+                params = (schema_instance.load(data),)
             except ValidationError as exc:
                 return {'errors': exc.messages}, 400
             args += params
@@ -60,27 +64,30 @@ def convert_to_instance(
     """
     if optional_filter is None:
         optional_filter = {}
+    static_filter = {**optional_filter}
+    if not allow_deleted:
+        static_filter[f'{check_deleted_by}__ne'] = 'deleted'
 
-    def to_instance_nosql(filter_data):
-        """Convert to instance from nosql db"""
+    if type_db == 'nosql':
         from mongoengine import ValidationError as MongoValidationError
-        try:
-            return model.objects.filter(**filter_data).first(), None
-        except MongoValidationError:
-            return None, {"errors": {field: 'Invalid identifier'}}
 
-    def to_instance_sql(filter_data):
-        """Convert to instance from sql db"""
-        return model.where(**filter_data).first(), None
+        def to_instance(filter_data):
+            """Convert to instance from nosql db"""
+            try:
+                return model.objects.filter(**filter_data).first(), None
+            except MongoValidationError:
+                return None, {"errors": {field: 'Invalid identifier'}}
+    else:
+        def to_instance(filter_data):
+            """Convert to instance from sql db"""
+            return model.where(**filter_data).first(), None
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             """Main func"""
-            filter_data = {field: kwargs.pop(field), **optional_filter}
-            if not allow_deleted:
-                filter_data.update({f'{check_deleted_by}__ne': 'deleted'})
-            doc, errors = to_instance_nosql(filter_data) if type_db == 'nosql' else to_instance_sql(filter_data)
+            filter_data = {field: kwargs.pop(field), **static_filter}
+            doc, errors = to_instance(filter_data)
             if errors:
                 return errors, 400
             if not doc:
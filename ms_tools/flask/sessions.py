@@ -1,6 +1,6 @@
 from functools import wraps
 
-from flask import _request_ctx_stack, has_request_context, session
+from flask import _request_ctx_stack, session
 
 
 class UserSession:
@@ -78,23 +78,22 @@ class UserSession:
 
     def get_current_user(self):
         """Получает текущего пользователя"""
-        if has_request_context() and not hasattr(_request_ctx_stack.top, 'user'):
+        ctx = _request_ctx_stack.top
+        if ctx is not None and not hasattr(ctx, 'user'):
             if user_id := session.get('user_id'):
                 if self.type_db == 'nosql':
-                    user = self.User.objects.filter(state='active', pk=user_id).first()
-                    _request_ctx_stack.top.user = user
+                    ctx.user = self.User.objects.filter(state='active', pk=user_id).first()
                 elif self.type_db == 'sql':
-                    user = self.User.where(state='active', pk=user_id).first()
-                    _request_ctx_stack.top.user = user
-            elif self.dev and hasattr(_request_ctx_stack.top.request.authorization, 'username') \
-                    and hasattr(_request_ctx_stack.top.request.authorization, 'password'):
-                email = _request_ctx_stack.top.request.authorization.username
-                token = _request_ctx_stack.top.request.authorization.password
+                    ctx.user = self.User.where(state='active', pk=user_id).first()
+            elif self.dev and hasattr(authorization := ctx.request.authorization, 'username') \
+                    and hasattr(authorization, 'password'):
+                email = authorization.username
+                token = authorization.password
 
                 if (user := self.User.get_by_email(email)) and user.check_token(token):
-                    _request_ctx_stack.top.user = user
+                    ctx.user = user
 
-        return getattr(_request_ctx_stack.top, 'user', None)
+        return getattr(ctx, 'user', None)
 
     def login_required(self, local_proxy: bool = False):
         """
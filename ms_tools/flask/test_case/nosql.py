@@ -327,18 +327,13 @@ class CommonTestCase(TestCase):
         """
         json_response = self._send_request(params={"order_by": f"-{field_name}" if reverse else field_name})
         self.validate_json(json_response, return_schema)
-        first_iteration = True
         self.assertGreater(json_response["total_count"], 0)
-        prev_value = None
-        for item in json_response['items']:
-            if first_iteration:
-                prev_value = item[field_name]
-                first_iteration = False
-                continue
+        values = [item[field_name] for item in json_response['items']]
+        for prev_value, value in zip(values, values[1:]):
             if reverse:
-                self.assertLessEqual(item[field_name], prev_value)
+                self.assertLessEqual(value, prev_value)
             else:
-                self.assertGreaterEqual(item[field_name], prev_value)
+                self.assertGreaterEqual(value, prev_value)
 
     def create_success(self, model, required_data):
         """Create success. Only required fields"""
@@ -461,10 +456,7 @@ class CommonTestCase(TestCase):
 
         # TODO Сделать более универсальным max_length min_length
         if max_length is not None:
-            bad_item = ""
-            for item in range(max_length + 1):
-                bad_item += "s"
-            bad_data.append(bad_item)
+            bad_data.append("s" * (max_length + 1))
 
         if min_length is not None:
             if valid_type == str:
@@ -479,12 +471,13 @@ class CommonTestCase(TestCase):
     @classmethod
     def _counter_data(cls, key_object, raw_data):
         new_data = {}
+        counters = cls.counter_map.get(key_object)
         for field, value in deepcopy(raw_data).items():
             if isinstance(value, str) and '{i}' in value:
-                cls.counter_map.setdefault(key_object, {})
-                last_count = cls.counter_map[key_object].get(field, 0)
-                cls.counter_map[key_object][field] = last_count + 1
-                new_data[field] = value.format(i=cls.counter_map[key_object][field])
+                if counters is None:
+                    counters = cls.counter_map[key_object] = {}
+                counters[field] = counters.get(field, 0) + 1
+                new_data[field] = value.format(i=counters[field])
             else:
                 new_data[field] = value
         return new_data
@@ -1,3 +1,6 @@
+import asyncio
+from functools import partial
+
 import requests
 
 
@@ -43,7 +46,9 @@ class SberbankAPI:
             "password": self.password,
         }
         params.update(data)
-        r = requests.post(url=f'{self.main_url}{method}', headers=headers, params=params)
+        # requests блокирует поток, поэтому запрос выполняется в пуле потоков, не останавливая event loop
+        send = partial(requests.post, url=f'{self.main_url}{method}', headers=headers, params=params)
+        r = await asyncio.get_running_loop().run_in_executor(None, send)
         return r.json()
 
     async def register_order(